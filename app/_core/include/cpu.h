@@ -158,6 +158,23 @@
 */
 #define SNEK8_SIZE_GRAPHICS              2048
 
+/**
+* @def SNEK8_SIZE_GRAPHICS_BYTES_PER_ROW
+* @brief The number of bytes that store a row of CHIP8's screen (8 pixels per byte).
+*/
+#define SNEK8_SIZE_GRAPHICS_BYTES_PER_ROW     8
+
+/**
+* @def SNEK8_SIZE_GRAPHICS_BYTES
+* @brief The total number of bytes that store CHIP8's screen.
+*/
+#define SNEK8_SIZE_GRAPHICS_BYTES        256
+
+/**
+* @def SNEK8_GRAPHICS_ALL_ROWS
+* @brief The mask of dirty rows covering the whole screen.
+*/
+#define SNEK8_GRAPHICS_ALL_ROWS          0xFFFFFFFFu
 
 /**
 * @def SNEK8_GRAPHICS_WIDTH
@@ -361,12 +378,17 @@ snek8_stackPop(Snek8Stack* stack, uint16_t* pc);
 * @param `memory` Array representation of Chip8's memory.
 * @param `keys` Chip8's 16 key set. Each bit represent a key that is either pressed
 *         or released.
-* @param `graphics` Array representation of Chip8's screen.
+* @param `graphics` Bitmap of Chip8's screen: each row takes
+*         SNEK8_SIZE_GRAPHICS_BYTES_PER_ROW bytes and the most significant bit of
+*         each byte is its leftmost pixel.
 * @param `implm_flags`. Controls which implementation to follow.
+* @param `graphics_dirty_rows` The rows of the screen that changed since the frontend
+*         last consumed them (bit y is row y). Only the instructions CLS and DRW
+*         set it.
 */
 typedef struct{
     uint8_t memory[SNEK8_SIZE_RAM];
-    uint8_t graphics[SNEK8_SIZE_GRAPHICS];
+    uint8_t graphics[SNEK8_SIZE_GRAPHICS_BYTES];
     Snek8Stack stack;
     uint8_t registers[SNEK8_SIZE_REGISTERS];
     uint16_t keys;
@@ -376,6 +398,7 @@ typedef struct{
     uint8_t sp;
     uint8_t st;
     uint8_t dt;
+    uint32_t graphics_dirty_rows;
 } Snek8CPU;
 
 /**
@@ -454,6 +477,14 @@ typedef struct{
 Snek8Instruction
 snek8_opcodeDecode(uint16_t opcode);
 
+/**
+* @brief Decrements the delay and sound timers, if they are active.
+*
+* @param[in, out] cpu
+*/
+void
+snek8_cpuTickTimers(Snek8CPU* cpu);
+
 /**
 * @brief Execute a step in the emulation process.
 * 
@@ -464,10 +495,24 @@ snek8_opcodeDecode(uint16_t opcode);
 * @param[out] instruction
 * @return A code representation on whether the execution was sucesseful indicating,
 * if not, the problem ocurred.
+* @note The timers are not ticked, see `snek8_cpuTickTimers`.
 */
 enum Snek8ExecutionOutput
 snek8_cpuStep(Snek8CPU* cpu, Snek8Instruction* instruction);
 
+/**
+* @brief Execute `n` consecutive steps in the emulation process, stopping at the
+* first step that is not sucesseful.
+*
+* @param[in, out] cpu
+* @param[in] n The number of steps to execute.
+* @param[out] instruction The last executed instruction.
+* @return The code of the last executed step.
+* @note The timers are not ticked, see `snek8_cpuTickTimers`.
+*/
+enum Snek8ExecutionOutput
+snek8_cpuStepN(Snek8CPU* cpu, size_t n, Snek8Instruction* instruction);
+
 /**
 * @brief The instruction representation of any instruction given by an invalid opcode.
 *
@@ -757,11 +802,16 @@ snek8_cpuJP_V0_ADDR(Snek8CPU* cpu, uint16_t opcode);
 enum Snek8ExecutionOutput
 snek8_cpuRND_VX_BYTE(Snek8CPU* cpu, uint16_t opcode);
 
-static inline uint8_t*
-snek8_cpuGetPixel(Snek8CPU* cpu, size_t x, size_t y){
+/**
+* @brief Retrieve whether the pixel at (x, y) is active. Coordinates wrap around
+* the screen.
+*/
+static inline bool
+snek8_cpuGetPixel(const Snek8CPU* cpu, size_t x, size_t y){
     size_t idx_x = x & 63;
     size_t idx_y = y & 31;
-    return &cpu->graphics[idx_y * SNEK8_GRAPHICS_WIDTH + idx_x];
+    uint8_t byte = cpu->graphics[idx_y * SNEK8_SIZE_GRAPHICS_BYTES_PER_ROW + (idx_x >> 3)];
+    return (byte >> (7u - (idx_x & 7u))) & 0x1u;
 }
 
 /**
@@ -773,8 +823,10 @@ snek8_cpuGetPixel(Snek8CPU* cpu, size_t x, size_t y){
 * @return Always returns `SNEK8_EXECOUT_SUCCESS`.
 *
 * @note The Chip8's original screen has 32x64 pixels. In our implementation, we represent
-* the screen as a contiguous block of 8-bit integers that can either be activated (1)
-* or deactivated (0), representing thus the black-white color scheme dealt by CHIP8.
+* the screen as a bitmap of 8 bytes per row, each bit being a pixel that can either be
+* activated (1) or deactivated (0), representing thus the black-white color scheme dealt
+* by CHIP8. Since a sprite row has the same layout as a screen byte, it is XORed into
+* (at most) two screen bytes at once.
 *
 * A sprite is an array of 8-bit integers whose length ranges from 1 to 16. The 
 * begining of the sprite is determined by the index register while its length is
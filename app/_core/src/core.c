@@ -130,6 +130,42 @@ snek8_emulatorInit(PyObject* self, PyObject* args, PyObject* kwargs){
     return 0;
 }
 
+/**
+* @brief Reset the emulator in place.
+*/
+static PyObject*
+snek8_emulatorReset(PyObject* self, PyObject* args, PyObject* kwargs){
+    int implm_flags = 0;
+    char* kwlist[] = {
+        "implm_flags",
+        NULL,
+    };
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "|i", kwlist, &implm_flags)){
+        return NULL;
+    }
+    if (implm_flags < 0 || implm_flags >= 255){
+        PyErr_Format(PyExc_ValueError, "Value %d is invalid for implementation.", implm_flags);
+        return NULL;
+    }
+    CAST_PTR(Snek8Emulator, self)->ob_is_running = false;
+    (void) snek8_cpuInit(&CAST_PTR(Snek8Emulator, self)->ob_cpu, (uint8_t) implm_flags);
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(SNEK8_DOC_STR_SNEK8_EMULATOR_RESET,
+             "reset(implm_flags: int = 0) -> None\n\n"
+             "Reset the emulator to its initial state, as if it had just been created.\n"
+             "The memory is reused, hence views retrieved by getGraphicsView remain valid.\n\n"
+             "Attributes\n"
+             "----------\n"
+             "implm_flags: int\n"
+             "\tThe implementation flags to use (see Snek8Emulator).\n"
+             "Raises\n"
+             "------\n"
+             "ValueError\n"
+             "\tIf implm_flags is not a valid value."
+);
+
 /*
 * CONSTANT METHODS
 * ------------------
@@ -324,11 +360,10 @@ snek8_emulatorGetGraphics(PyObject* self, PyObject* args){
         return NULL;
     }
     for (size_t i = 0; i < SNEK8_SIZE_GRAPHICS; i++){
-        if (CAST_PTR(Snek8Emulator, self)->ob_cpu.graphics[i]){
-            PyList_SET_ITEM(graphics_list, i, Py_True);
-        }else{
-            PyList_SET_ITEM(graphics_list, i, Py_False);
-        }
+        bool pixel = snek8_cpuGetPixel(&CAST_PTR(Snek8Emulator, self)->ob_cpu,
+                                       i % SNEK8_GRAPHICS_WIDTH, i / SNEK8_GRAPHICS_WIDTH);
+        // PyList_SET_ITEM steals the reference that PyBool_FromLong hands over.
+        PyList_SET_ITEM(graphics_list, i, PyBool_FromLong(pixel));
     }
     return graphics_list;
 }
@@ -342,6 +377,44 @@ PyDoc_STRVAR(SNEK8_DOC_STR_SNEK8_EMULATOR_GET_GRAPHICS,
              "\tThe current values of pixels."
 );
 
+/**
+* @brief C interface for the buffer protocol. Exports the screen as a read-only
+* contiguous block of SNEK8_SIZE_GRAPHICS_BYTES bytes.
+*/
+static int
+snek8_emulatorGetBuffer(PyObject* self, Py_buffer* view, int flags){
+    return PyBuffer_FillInfo(view, self, CAST_PTR(Snek8Emulator, self)->ob_cpu.graphics,
+                             SNEK8_SIZE_GRAPHICS_BYTES, 1, flags);
+}
+
+static PyBufferProcs snek8_emulator_buffer_procs = {
+    .bf_getbuffer = snek8_emulatorGetBuffer,
+    .bf_releasebuffer = NULL,
+};
+
+/**
+* @brief Retrieve a zero-copy view of the screen.
+*/
+static PyObject*
+snek8_emulatorGetGraphicsView(PyObject* self, PyObject* args){
+    UNUSED(args);
+    return PyMemoryView_FromObject(self);
+}
+
+PyDoc_STRVAR(SNEK8_DOC_STR_SNEK8_EMULATOR_GET_GRAPHICS_VIEW,
+             "getGraphicsView() -> memoryview\n\n"
+             "Retrieve a read-only view of the screen.\n"
+             "The view shares the emulator's memory, hence it always reflects the current "
+             "state of the screen and does not need to be retrieved again after each "
+             "emulation step.\n"
+             "Returns\n"
+             "-------\n"
+             "memoryview\n"
+             "\tA view of SIZE_GRAPHICS_BYTES bytes, SIZE_GRAPHICS_BYTES_PER_ROW per row. "
+             "The pixel at (pos_x, pos_y) is active iff the bit 7 - pos_x % 8 of "
+             "view[pos_y * SIZE_GRAPHICS_BYTES_PER_ROW + pos_x // 8] is set."
+);
+
 static PyObject*
 snek8_emulatorIsPixelActive(PyObject* self, PyObject* args, PyObject* kwargs){
     int pos_x;
@@ -354,7 +427,7 @@ snek8_emulatorIsPixelActive(PyObject* self, PyObject* args, PyObject* kwargs){
     if (!PyArg_ParseTupleAndKeywords(args, kwargs, "ii", kw_list, &pos_x, &pos_y)){
         return NULL;
     }
-    if (*snek8_cpuGetPixel(&CAST_PTR(Snek8Emulator, self)->ob_cpu, pos_x, pos_y)){
+    if (snek8_cpuGetPixel(&CAST_PTR(Snek8Emulator, self)->ob_cpu, pos_x, pos_y)){
         Py_RETURN_TRUE;
     }else{
         Py_RETURN_FALSE;
@@ -418,11 +491,11 @@ snek8_emulatorGetKeyValue(PyObject* self, PyObject* args, PyObject* kwargs){
         return NULL;
     }
     if (key < 0 || key >= 16){
-        PyErr_Format(PyExc_IndexError, "Index must be between 0 and 15 (incl.). Value recieved: %d.", index);
+        PyErr_Format(PyExc_IndexError, "Index must be between 0 and 15 (incl.). Value recieved: %d.", key);
         return NULL;
     }
     bool value = snek8_cpuGetKeyVal(CAST_PTR(Snek8Emulator, self)->ob_cpu, key);
-    return value? Py_True: Py_False;
+    return PyBool_FromLong(value);
 }
 
 PyDoc_STRVAR(SNEK8_DOC_STR_SNEK8_EMULATOR_GET_KEY_VALUE,
@@ -488,7 +561,7 @@ snek8_emulatorTurnFlagsOff(PyObject* self, PyObject* args, PyObject* kwargs){
     if (!PyArg_ParseTupleAndKeywords(args, kwargs, "i", kwlist, &flags)){
         return NULL;
     }
-    CAST_PTR(Snek8Emulator, self)->ob_cpu.implm_flags ^= ((uint8_t) flags);
+    CAST_PTR(Snek8Emulator, self)->ob_cpu.implm_flags &= (uint8_t) ~flags;
     Py_RETURN_NONE;
 }
 
@@ -509,6 +582,36 @@ PyDoc_STRVAR(SNEK8_DOC_STR_SNEK8_EMULATOR_TURN_FLAGS_OFF,
              "\tIf the implm is not a valid value."
 );
 
+static PyObject*
+snek8_emulatorSetFlags(PyObject* self, PyObject* arg){
+    long flags = PyLong_AsLong(arg);
+    if (flags == -1 && PyErr_Occurred()){
+        return NULL;
+    }
+    if (flags < 0 || flags >= 255){
+        PyErr_Format(PyExc_ValueError, "Value %ld is invalid for implementation.", flags);
+        return NULL;
+    }
+    CAST_PTR(Snek8Emulator, self)->ob_cpu.implm_flags = (uint8_t) flags;
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(SNEK8_DOC_STR_SNEK8_EMULATOR_SET_FLAGS,
+             "setFlags(flags: int) -> None\n\n"
+             "Replace the emulator's implementation flags.\n\n"
+             "Attributes\n"
+             "----------\n"
+             "flags: int\n"
+             "\tThe new implementation flags, a bitwise or combination of the "
+             "IMPL_MODE_* constants.\n"
+             "Raises\n"
+             "------\n"
+             "TypeError\n"
+             "\tIf flags is not an integer.\n"
+             "ValueError\n"
+             "\tIf flags is not a valid value."
+);
+
 static PyObject*
 snek8_emulatorSetRunning(PyObject* self, PyObject* args, PyObject* kwargs){
     bool is_running;
@@ -567,6 +670,38 @@ PyDoc_STRVAR(SNEK8_DOC_STR_SNEK8_EMULATOR_SET_KEY_VALUE,
              "\tIf the key index is not a valid index, i.e. key < 0 or key >= 16."
 );
 
+/**
+* @brief Load the state of all keys at once. Called once per CPU tick (METH_O).
+*/
+static PyObject*
+snek8_emulatorSetKeysMask(PyObject* self, PyObject* arg){
+    long mask = PyLong_AsLong(arg);
+    if (mask == -1 && PyErr_Occurred()){
+        return NULL;
+    }
+    if (mask < 0 || mask > 0xFFFF){
+        PyErr_Format(PyExc_ValueError, "The keys mask must fit in 16 bits. Value recieved: %ld.", mask);
+        return NULL;
+    }
+    CAST_PTR(Snek8Emulator, self)->ob_cpu.keys = (uint16_t) mask;
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(SNEK8_DOC_STR_SNEK8_EMULATOR_SET_KEYS_MASK,
+             "setKeysMask(mask: int) -> None\n\n"
+             "Set the state of all keys at once.\n"
+             "Attributes\n"
+             "----------\n"
+             "mask: int\n"
+             "\tA 16-bit mask whose bit k is set iff the key k is pressed.\n\n"
+             "Raises\n"
+             "------\n"
+             "TypeError\n"
+             "\tIf mask is not an integer.\n"
+             "ValueError\n"
+             "\tIf mask does not fit in 16 bits."
+);
+
 static PyObject*
 _snek8_emulatorExecOpc(PyObject* self, PyObject* args, PyObject* kwargs){
     int code = 0;
@@ -617,11 +752,15 @@ snek8_emulatorLoadRom(PyObject* self, PyObject* args, PyObject* kwargs){
     if (!rom_filepath){
         return NULL;
     }
-    enum Snek8ExecutionOutput out = snek8_cpuLoadRom(&CAST_PTR(Snek8Emulator, self)->ob_cpu, rom_filepath);
+    enum Snek8ExecutionOutput out;
+    // The ROM is read straight into the CPU memory, no Python object is touched.
+    Py_BEGIN_ALLOW_THREADS
+    out = snek8_cpuLoadRom(&CAST_PTR(Snek8Emulator, self)->ob_cpu, rom_filepath);
+    Py_END_ALLOW_THREADS
     if (out == SNEK8_EXECOUT_SUCCESS){
         CAST_PTR(Snek8Emulator, self)->ob_is_running = true;
     }
-    return PyBool_FromLong((long) out);
+    return PyLong_FromLong((long) out);
 }
 
 PyDoc_STRVAR(SNEK8_DOC_STR_SNEK8_EMULATOR_LOAD_ROM,
@@ -643,6 +782,7 @@ snek8_emulatorEmulationStep(PyObject* self, PyObject* args){
     Snek8Instruction instruc;
     enum Snek8ExecutionOutput out = snek8_cpuStep(&CAST_PTR(Snek8Emulator, self)->ob_cpu,
                                                  &instruc);
+    snek8_cpuTickTimers(&CAST_PTR(Snek8Emulator, self)->ob_cpu);
     // printf("%s\n", instruc.code);
     // TO-DO: DEAL WITH EXEC ERRORS.
     if (out != SNEK8_EXECOUT_SUCCESS){
@@ -660,10 +800,91 @@ PyDoc_STRVAR(SNEK8_DOC_STR_SNEK8_EMULATOR_EMU_STEP,
              "\tThe execution output code representing whether the execution was successeful."
 );
 
+/**
+* @brief Execute n steps. Called once per CPU tick, hence it takes its single
+* argument directly (METH_O) rather than through the argument parser.
+*/
+static PyObject*
+snek8_emulatorEmulationStepN(PyObject* self, PyObject* arg){
+    long n = PyLong_AsLong(arg);
+    if (n == -1 && PyErr_Occurred()){
+        return NULL;
+    }
+    if (n < 0){
+        PyErr_Format(PyExc_ValueError, "The number of steps must be non-negative. Value recieved: %ld.", n);
+        return NULL;
+    }
+    Snek8Instruction instruc;
+    enum Snek8ExecutionOutput out = snek8_cpuStepN(&CAST_PTR(Snek8Emulator, self)->ob_cpu,
+                                                  (size_t) n, &instruc);
+    if (out != SNEK8_EXECOUT_SUCCESS){
+        CAST_PTR(Snek8Emulator, self)->ob_is_running = false;
+    }
+    return PyLong_FromLong((long) out);
+}
+
+PyDoc_STRVAR(SNEK8_DOC_STR_SNEK8_EMULATOR_EMU_STEP_N,
+             "emulationStepN(n: int) -> int\n\n"
+             "Execute n steps in the emulation process, stopping at the first step\n"
+             "that is not successeful. The timers are not ticked (see tickTimers).\n"
+             "Attributes\n"
+             "----------\n"
+             "n: int\n"
+             "\tThe number of steps to execute.\n"
+             "Returns\n"
+             "-------\n"
+             "int\n"
+             "\tThe execution output code of the last executed step.\n"
+             "Raises\n"
+             "------\n"
+             "TypeError\n"
+             "\tIf n is not an integer.\n"
+             "ValueError\n"
+             "\tIf n is negative."
+);
+
+static PyObject*
+snek8_emulatorTickTimers(PyObject* self, PyObject* args){
+    UNUSED(args);
+    snek8_cpuTickTimers(&CAST_PTR(Snek8Emulator, self)->ob_cpu);
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(SNEK8_DOC_STR_SNEK8_EMULATOR_TICK_TIMERS,
+             "tickTimers() -> None\n\n"
+             "Decrement the delay and sound timers, if not already zero.\n"
+             "CHIP8's timers run at 60Hz, independently of the instruction rate."
+);
+
+static PyObject*
+snek8_emulatorConsumeDirty(PyObject* self, PyObject* args){
+    UNUSED(args);
+    Snek8CPU* cpu = &CAST_PTR(Snek8Emulator, self)->ob_cpu;
+    uint32_t rows = cpu->graphics_dirty_rows;
+    cpu->graphics_dirty_rows = 0;
+    return PyLong_FromUnsignedLong((unsigned long) rows);
+}
+
+PyDoc_STRVAR(SNEK8_DOC_STR_SNEK8_EMULATOR_CONSUME_DIRTY,
+             "consumeDirty() -> int\n\n"
+             "Retrieve which rows of the screen changed since the last call and clear them.\n"
+             "Returns\n"
+             "-------\n"
+             "int\n"
+             "\tA mask whose bit y is set iff the row y has to be redrawn; zero if the "
+             "screen did not change."
+);
+
 #pragma GCC diagnostic push
 #pragma GCC diagnostic ignored "-Wcast-function-type"
 
 static struct PyMethodDef snek8_emulator_methods[] = {
+    {
+        .ml_name = "reset",
+        .ml_meth = (PyCFunction) snek8_emulatorReset,
+        .ml_flags = METH_VARARGS | METH_KEYWORDS,
+        .ml_doc = SNEK8_DOC_STR_SNEK8_EMULATOR_RESET,
+    },
     {
         .ml_name = "getMode",
         .ml_meth = snek8_emulatorGetFlags,
@@ -706,6 +927,12 @@ static struct PyMethodDef snek8_emulator_methods[] = {
         .ml_flags = METH_NOARGS,
         .ml_doc = SNEK8_DOC_STR_SNEK8_EMULATOR_GET_GRAPHICS,
     },
+    {
+        .ml_name = "getGraphicsView",
+        .ml_meth = snek8_emulatorGetGraphicsView,
+        .ml_flags = METH_NOARGS,
+        .ml_doc = SNEK8_DOC_STR_SNEK8_EMULATOR_GET_GRAPHICS_VIEW,
+    },
     {
         .ml_name = "isPixelActive",
         .ml_meth = (PyCFunction) snek8_emulatorIsPixelActive,
@@ -748,6 +975,12 @@ static struct PyMethodDef snek8_emulator_methods[] = {
         .ml_flags = METH_VARARGS | METH_KEYWORDS,
         .ml_doc = SNEK8_DOC_STR_SNEK8_EMULATOR_TURN_FLAGS_OFF,
     },
+    {
+        .ml_name = "setFlags",
+        .ml_meth = snek8_emulatorSetFlags,
+        .ml_flags = METH_O,
+        .ml_doc = SNEK8_DOC_STR_SNEK8_EMULATOR_SET_FLAGS,
+    },
     {
         .ml_name = "setRunning",
         .ml_meth = (PyCFunction) snek8_emulatorSetRunning,
@@ -766,6 +999,12 @@ static struct PyMethodDef snek8_emulator_methods[] = {
         .ml_flags = METH_VARARGS | METH_KEYWORDS,
         .ml_doc = SNEK8_DOC_STR_SNEK8_EMULATOR_SET_KEY_VALUE,
     },
+    {
+        .ml_name = "setKeysMask",
+        .ml_meth = snek8_emulatorSetKeysMask,
+        .ml_flags = METH_O,
+        .ml_doc = SNEK8_DOC_STR_SNEK8_EMULATOR_SET_KEYS_MASK,
+    },
     {
         .ml_name = "_execOpc",
         .ml_meth = (PyCFunction) _snek8_emulatorExecOpc,
@@ -778,6 +1017,24 @@ static struct PyMethodDef snek8_emulator_methods[] = {
         .ml_flags = METH_NOARGS,
         .ml_doc = SNEK8_DOC_STR_SNEK8_EMULATOR_EMU_STEP,
     },
+    {
+        .ml_name = "emulationStepN",
+        .ml_meth = snek8_emulatorEmulationStepN,
+        .ml_flags = METH_O,
+        .ml_doc = SNEK8_DOC_STR_SNEK8_EMULATOR_EMU_STEP_N,
+    },
+    {
+        .ml_name = "tickTimers",
+        .ml_meth = snek8_emulatorTickTimers,
+        .ml_flags = METH_NOARGS,
+        .ml_doc = SNEK8_DOC_STR_SNEK8_EMULATOR_TICK_TIMERS,
+    },
+    {
+        .ml_name = "consumeDirty",
+        .ml_meth = snek8_emulatorConsumeDirty,
+        .ml_flags = METH_NOARGS,
+        .ml_doc = SNEK8_DOC_STR_SNEK8_EMULATOR_CONSUME_DIRTY,
+    },
     {NULL},
 };
 #pragma GCC diagnostic pop
@@ -804,6 +1061,7 @@ static PyTypeObject Snek8EmulatorType = {
      .tp_dealloc = (destructor) snek8_emulatorDel,
      .tp_members = snek8_emulator_members,
      .tp_methods = snek8_emulator_methods,
+     .tp_as_buffer = &snek8_emulator_buffer_procs,
 };
 
 PyDoc_STRVAR(SNEK8_STR_DOC_PY8,
@@ -873,6 +1131,9 @@ PyInit_core(void){
     (void) PyModule_AddIntConstant(module, "SIZE_GRAPHICS_WIDTH", SNEK8_GRAPHICS_WIDTH);
     (void) PyModule_AddIntConstant(module, "SIZE_GRAPHICS_HEIGHT", SNEK8_GRAPHICS_HEIGTH);
     (void) PyModule_AddIntConstant(module, "SIZE_GRAPHICS", SNEK8_SIZE_GRAPHICS);
+    (void) PyModule_AddIntConstant(module, "SIZE_GRAPHICS_BYTES", SNEK8_SIZE_GRAPHICS_BYTES);
+    (void) PyModule_AddIntConstant(module, "SIZE_GRAPHICS_BYTES_PER_ROW",
+                                   SNEK8_SIZE_GRAPHICS_BYTES_PER_ROW);
     (void) PyModule_AddIntConstant(module, "SIZE_FONTSET_PIXELS", SNEK8_SIZE_FONTSET_PIXELS);
     (void) PyModule_AddIntConstant(module, "SIZE_FONTSET_SPRITE", SNEK8_SIZE_FONTSET_PIXEL_PER_SPRITE);
     (void) PyModule_AddIntConstant(module, "MEM_ADDR_PROGRM_START", SNEK8_MEM_ADDR_PROG_START);
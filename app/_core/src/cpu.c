@@ -81,11 +81,12 @@ snek8_cpuInit(Snek8CPU* cpu, uint8_t implm_flags){
     cpu->ir = 0;
     cpu->sp = 0;
     cpu->dt = 0;
-    cpu->sp = 0;
+    cpu->st = 0;
+    cpu->graphics_dirty_rows = SNEK8_GRAPHICS_ALL_ROWS;
     (void) snek8_stackInit(&cpu->stack);
     (void) memset(&cpu->registers, 0, SNEK8_SIZE_REGISTERS * SIZE_U8);
     (void) memset(&cpu->memory, 0, SNEK8_SIZE_RAM * SIZE_U8);
-    (void) memset(&cpu->graphics, 0, SNEK8_SIZE_GRAPHICS * SIZE_U8);
+    (void) memset(&cpu->graphics, 0, SNEK8_SIZE_GRAPHICS_BYTES * SIZE_U8);
     (void) memcpy(cpu->memory + SNEK8_MEM_ADDR_FONTSET_START, fontset, SNEK8_SIZE_FONTSET_PIXELS * SIZE_U8);
     return SNEK8_EXECOUT_SUCCESS;
 }
@@ -98,7 +99,7 @@ snek8_cpuLoadRom(Snek8CPU* cpu, const char* rom_file_path){
         return SNEK8_EXECOUT_ROM_FILE_INVALID;
     }
     FILE* rom_file = fopen(rom_file_path, "rb");
-    if (!rom_file_path){
+    if (!rom_file){
         return SNEK8_EXECOUT_ROM_FILE_FAILED_TO_OPEN;
     }
     (void) fseek(rom_file, 0, SEEK_END);
@@ -117,13 +118,8 @@ snek8_cpuLoadRom(Snek8CPU* cpu, const char* rom_file_path){
     return SNEK8_EXECOUT_SUCCESS;
 }
 
-/**
-* @brief Manages the CPU timers.
-*
-* @param `cpu`.
-*/
-static inline void
-_snek8_cpuTickTimers(Snek8CPU* cpu){
+void
+snek8_cpuTickTimers(Snek8CPU* cpu){
     if (cpu->dt){
         cpu->dt--;
     }
@@ -191,7 +187,8 @@ snek8_cpuExecutionError(Snek8CPU* cpu, uint16_t opcode){
 enum Snek8ExecutionOutput
 snek8_cpuCLS(Snek8CPU* cpu, uint16_t opcode){
     UNUSED opcode;
-    UNUSED memset(&cpu->graphics, 0, SNEK8_SIZE_GRAPHICS * SIZE_U8);
+    UNUSED memset(&cpu->graphics, 0, SNEK8_SIZE_GRAPHICS_BYTES * SIZE_U8);
+    cpu->graphics_dirty_rows = SNEK8_GRAPHICS_ALL_ROWS;
     return SNEK8_EXECOUT_SUCCESS;
 }
 
@@ -488,6 +485,32 @@ snek8_cpuRND_VX_BYTE(Snek8CPU* cpu, uint16_t opcode){
 }
 
 
+/**
+* @brief Load a screen row as a single 64-bit word, its leftmost pixel being the
+* most significant bit.
+*
+* @param `row_ptr` The first of the SNEK8_SIZE_GRAPHICS_BYTES_PER_ROW bytes of the row.
+*/
+static inline uint64_t
+_snek8_cpuLoadScreenRow(const uint8_t* row_ptr){
+    uint64_t word = 0;
+    for (size_t i = 0; i < SNEK8_SIZE_GRAPHICS_BYTES_PER_ROW; i++){
+        word = (word << 8) | row_ptr[i];
+    }
+    return word;
+}
+
+/**
+* @brief Store a 64-bit word into a screen row (see `_snek8_cpuLoadScreenRow`).
+*/
+static inline void
+_snek8_cpuStoreScreenRow(uint8_t* row_ptr, uint64_t word){
+    for (size_t i = SNEK8_SIZE_GRAPHICS_BYTES_PER_ROW; i > 0; i--){
+        row_ptr[i - 1] = (uint8_t) word;
+        word >>= 8;
+    }
+}
+
 /*
 * DRW V{0xX}, V{0xY}, 0xN
 * 0xDXYN
@@ -501,19 +524,27 @@ snek8_cpuDRW_VX_VY_N(Snek8CPU* cpu, uint16_t opcode){
     if (cpu->ir + n > SNEK8_MEM_ADDR_RAM_END){
         return SNEK8_EXECOUT_MEM_ADDR_OUT_OF_BOUNDS;
     }
-    uint8_t px = cpu->registers[x];
+    uint8_t px = cpu->registers[x] & 63u;
     uint8_t py = cpu->registers[y];
-    for (uint8_t col = 0; col < n; col++){
-        uint8_t byte = cpu->memory[cpu->ir + col];
-        for (uint8_t row = 0; row < 8; row++){
-            uint8_t bit = byte & (0x80u >> row);
-            uint8_t* pixel_ptr = snek8_cpuGetPixel(cpu, px + row, py + col);
-            *pixel_ptr ^= bit;
-            if (bit && *pixel_ptr == 0){
-                cpu->registers[0xF] = 1;
-            }
-        }
+    // Each screen row is handled as one 64-bit word: the sprite row is placed
+    // at the top byte and rotated right by px, which also wraps its right end
+    // around to the start of the row.
+    uint64_t collisions = 0;
+    for (uint8_t row = 0; row < n; row++){
+        uint8_t byte = cpu->memory[cpu->ir + row];
+        uint8_t idx_y = (py + row) & 31u;
+        uint64_t sprite = (uint64_t) byte << 56;
+        sprite = (sprite >> px) | (sprite << ((64u - px) & 63u));
+        uint8_t* row_ptr = &cpu->graphics[idx_y * SNEK8_SIZE_GRAPHICS_BYTES_PER_ROW];
+        uint64_t screen_row = _snek8_cpuLoadScreenRow(row_ptr);
+        collisions |= screen_row & sprite;
+        _snek8_cpuStoreScreenRow(row_ptr, screen_row ^ sprite);
+        // Only sprite rows with pixels set actually change the screen.
+        cpu->graphics_dirty_rows |= (uint32_t) (byte != 0) << idx_y;
     }
+    // VF is 1 iff the sprite erased at least one pixel and 0 otherwise, as the
+    // pixel-by-pixel version did (it cleared VF on entry).
+    cpu->registers[0xF] = collisions != 0;
     return SNEK8_EXECOUT_SUCCESS;
 }
 
@@ -952,8 +983,15 @@ snek8_cpuStep(Snek8CPU* cpu, Snek8Instruction* instruction){
     uint16_t opcode = _snek8_cpuGetOpcode(*cpu);
     _snek8_cpuIncrementPC(cpu);
     *instruction = snek8_opcodeDecode(opcode);
-    enum Snek8ExecutionOutput out = instruction->exec(cpu, opcode);
-    _snek8_cpuTickTimers(cpu);
+    return instruction->exec(cpu, opcode);
+}
+
+enum Snek8ExecutionOutput
+snek8_cpuStepN(Snek8CPU* cpu, size_t n, Snek8Instruction* instruction){
+    enum Snek8ExecutionOutput out = SNEK8_EXECOUT_SUCCESS;
+    for (size_t i = 0; i < n && out == SNEK8_EXECOUT_SUCCESS; i++){
+        out = snek8_cpuStep(cpu, instruction);
+    }
     return out;
 }
 
@@ -1,4 +1,3 @@
-PARENT_DIR: str = 'snek8'
 """
 @file app.py
 @author Paulo Arruda
@@ -10,11 +9,12 @@ import sys
 from snek8 import core as snek8core
 from main_window import Snek8MainWindow
 from screen import Snek8Screen
-from typing import List, Dict, Callable
-from PyQt6.QtWidgets import QApplication, QFileDialog
-from PyQt6.QtGui import QIcon, QGuiApplication
-from PyQt6.QtCore import Qt, QBasicTimer, QTimer
-from PyQt6.QtMultimedia import QSoundEffect
+from functools import partial
+from types import MappingProxyType
+from typing import List, Dict, Mapping, Callable
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtGui import QGuiApplication
+from PyQt6.QtCore import Qt, QElapsedTimer, QThreadPool, QTimerEvent, pyqtSignal
 
 
 class Snek8App(QApplication):
@@ -28,147 +28,173 @@ class Snek8App(QApplication):
     Parameters
     ----------
     """
-    rom_filepath: str = NotImplemented
-    snek8_emulator: snek8core.Snek8Emulator = NotImplemented
-    snek8_main_win: Snek8MainWindow = NotImplemented
-    snek8_screen: Snek8Screen = NotImplemented
-    snek8_impl_bnnn_uses_vx: bool = NotImplemented
-    snek8_impl_fx_changes_ir: bool = NotImplemented
-    snek8_impl_shifts_use_vy: bool = NotImplemented
-    is_paused: bool = NotImplemented
-    timer: QTimer = NotImplemented
-    fps: int = NotImplemented
-
-    @property
-    def STATUS_BAR_DEFAULT(self) -> str:
-        return "Please select a ROM file."
-
-    @property
-    def STATUS_BAR_RUNNING(self) -> str:
-        return f"Now running {self.rom_filepath}"
-
-    @property
-    def STATUS_BAR_PAUSED(self) -> str:
-        return "Paused."
-
-    @property
-    def CPU_KEY_MAP(self) -> Dict[int, List[Callable]]:
-        return {
-            ## Chip8 keyset
-            Qt.Key.Key_1: [
-                lambda: self.snek8_emulator.setKeyValue(0x1, False),
-                lambda: self.snek8_emulator.setKeyValue(0x1, True),
-            ],
-            Qt.Key.Key_2: [
-                lambda: self.snek8_emulator.setKeyValue(0x2, False),
-                lambda: self.snek8_emulator.setKeyValue(0x2, True),
-            ],
-            Qt.Key.Key_3: [
-                lambda: self.snek8_emulator.setKeyValue(0x3, False),
-                lambda: self.snek8_emulator.setKeyValue(0x3, True),
-            ],
-            Qt.Key.Key_4: [
-                lambda: self.snek8_emulator.setKeyValue(0xC, False),
-                lambda: self.snek8_emulator.setKeyValue(0xC, True),
-            ],
-
-            Qt.Key.Key_Q: [
-                lambda: self.snek8_emulator.setKeyValue(0x4, False),
-                lambda: self.snek8_emulator.setKeyValue(0x4, True),
-            ],
-            Qt.Key.Key_W: [
-                lambda: self.snek8_emulator.setKeyValue(0x5, False),
-                lambda: self.snek8_emulator.setKeyValue(0x5, True),
-            ],
-            Qt.Key.Key_E: [
-                lambda: self.snek8_emulator.setKeyValue(0x6, False),
-                lambda: self.snek8_emulator.setKeyValue(0x6, True),
-            ],
-            Qt.Key.Key_R: [
-                lambda: self.snek8_emulator.setKeyValue(0xD, False),
-                lambda: self.snek8_emulator.setKeyValue(0xD, True),
-            ],
-
-            Qt.Key.Key_A: [
-                lambda: self.snek8_emulator.setKeyValue(0x7, False),
-                lambda: self.snek8_emulator.setKeyValue(0x7, True),
-            ],
-            Qt.Key.Key_S: [
-                lambda: self.snek8_emulator.setKeyValue(0x8, False),
-                lambda: self.snek8_emulator.setKeyValue(0x8, True),
-            ],
-            Qt.Key.Key_D: [
-                lambda: self.snek8_emulator.setKeyValue(0x9, False),
-                lambda: self.snek8_emulator.setKeyValue(0x9, True),
-            ],
-            Qt.Key.Key_F: [
-                lambda: self.snek8_emulator.setKeyValue(0xE, False),
-                lambda: self.snek8_emulator.setKeyValue(0xE, True),
-            ],
-
-            Qt.Key.Key_Y: [
-                lambda: self.snek8_emulator.setKeyValue(0xA, False),
-                lambda: self.snek8_emulator.setKeyValue(0xA, True),
-            ],
-            Qt.Key.Key_X: [
-                lambda: self.snek8_emulator.setKeyValue(0x0, False),
-                lambda: self.snek8_emulator.setKeyValue(0x0, True),
-            ],
-            Qt.Key.Key_C: [
-                lambda: self.snek8_emulator.setKeyValue(0xB, False),
-                lambda: self.snek8_emulator.setKeyValue(0xB, True),
-            ],
-            Qt.Key.Key_V: [
-                lambda: self.snek8_emulator.setKeyValue(0xF, False),
-                lambda: self.snek8_emulator.setKeyValue(0xF, True),
-            ],
-        }
-    @property
-    def APP_KEY_MAP(self) -> Dict[int, Callable]:
-        return {
-            Qt.Key.Key_P: lambda: self.pause(),
-            Qt.Key.Key_Escape: lambda: self.snek8_main_win.close(),
-            Qt.Key.Key_L: lambda: self.loadRom(),
-        }
+    __slots__ = (
+        "rom_filepath",
+        "_last_rom_dir",
+        "_status_running",
+        "snek8_emulator",
+        "snek8_main_win",
+        "snek8_screen",
+        "_impl_flags",
+        "is_paused",
+        "_loading",
+        "_cpu_timer_id",
+        "_render_timer_id",
+        "fps",
+        "cycles_per_frame",
+        "_ips",
+        "_max_lag",
+        "_cpu_interval",
+        "_elapsed",
+        "_cycles",
+        "_timers_elapsed",
+        "_timer_ticks",
+        "_app_key_map",
+        "_gfx_view",
+        "_err_handlers",
+        "_step_n",
+        "_set_keys_mask",
+        "_get_st",
+        "_tick_timers",
+        "_consume_dirty",
+        "_update_screen",
+    )
+    rom_filepath: str
+    _last_rom_dir: str
+    _status_running: str
+    snek8_emulator: snek8core.Snek8Emulator
+    snek8_main_win: Snek8MainWindow
+    snek8_screen: Snek8Screen
+    _impl_flags: int
+    is_paused: bool
+    _loading: bool
+    _cpu_timer_id: int
+    _render_timer_id: int
+    fps: int
+    cycles_per_frame: int
+    _ips: int
+    _max_lag: int
+    _cpu_interval: int
+    _elapsed: QElapsedTimer
+    _cycles: int
+    _timers_elapsed: QElapsedTimer
+    _timer_ticks: int
+    _app_key_map: Dict[int, Callable]
+    _gfx_view: memoryview
+    _err_handlers: Dict[int, Callable]
+    _step_n: Callable[[int], int]
+    _set_keys_mask: Callable[[int], None]
+    _get_st: Callable[[], int]
+    _tick_timers: Callable[[], None]
+    _consume_dirty: Callable[[], int]
+    _update_screen: Callable[[memoryview, int], None]
+
+    # Emitted from the loader thread with the output of Snek8Emulator.loadRom
+    # and the path of the ROM it loaded.
+    romLoaded = pyqtSignal(int, str)
+
+    STATUS_BAR_DEFAULT: str = "Please select a ROM file."
+    STATUS_BAR_PAUSED: str = "Paused."
+    # CHIP8's delay and sound timers count down at 60 Hz.
+    TIMERS_HZ: int = 60
+    # Qt key -> Chip8 key. Read-only, it is shared by every instance.
+    _KEY_TABLE: Mapping[int, int] = MappingProxyType({
+        Qt.Key.Key_1: 0x1, Qt.Key.Key_2: 0x2, Qt.Key.Key_3: 0x3, Qt.Key.Key_4: 0xC,
+        Qt.Key.Key_Q: 0x4, Qt.Key.Key_W: 0x5, Qt.Key.Key_E: 0x6, Qt.Key.Key_R: 0xD,
+        Qt.Key.Key_A: 0x7, Qt.Key.Key_S: 0x8, Qt.Key.Key_D: 0x9, Qt.Key.Key_F: 0xE,
+        Qt.Key.Key_Z: 0xA, Qt.Key.Key_X: 0x0, Qt.Key.Key_C: 0xB, Qt.Key.Key_V: 0xF,
+    })
+    # Execution output code -> message reported to the user.
+    _ERR_MESSAGES: Dict[int, str] = {
+        snek8core.EXECOUT_INVALID_OPCODE: "Invalid opcode.",
+        snek8core.EXECOUT_STACK_EMPTY: "Return with an empty stack.",
+        snek8core.EXECOUT_STACK_OVERFLOW: "Stack overflow.",
+        snek8core.EXECOUT_MEM_ADDR_OUT_BOUNDS: "Memory address out of bounds.",
+        snek8core.EXECOUT_ROM_FILE_NOT_FOUND: "ROM file not found.",
+        snek8core.EXECOUT_ROM_FILE_FAILED_TO_OPEN: "Failed to open the ROM file.",
+        snek8core.EXECOUT_ROM_FILE_FAILED_TO_READ: "Failed to read the ROM file.",
+        snek8core.EXECOUT_ROM_FILE_EXCEEDS_MAX_MEM: "The ROM file does not fit in memory.",
+    }
+    # Implementation menu entry -> core implementation flag.
+    _IMPL_TABLE: Dict[str, int] = {
+        "Shifts use VY": snek8core.IMPL_MODE_SHIFTS_USE_VY,
+        "BNNN uses VX": snek8core.IMPL_MODE_BNNN_USES_VX,
+        "FX changes I": snek8core.IMPL_MODE_FX_CHANGES_I,
+    }
 
-    @property
-    def WIDTH(self) -> int:
-        return 640
-
-    @property
-    def HEIGHT(self) -> int:
-        return 360
-    
     def __init__(self, argv: List[str]) -> None:
         super(Snek8App, self).__init__(argv)
         self.initCore()
         self.initUI()
         self.snek8_main_win.show()
-        self.timer.timeout.connect(self.emulate)
-        self.timer.start(1)
+        self.romLoaded.connect(self._onRomLoaded)
         # self.emulate()
 
     def initUI(self) -> None:
-        self.snek8_main_win = Snek8MainWindow("Snek8 - Chip8 Emulator",
-                                      self.WIDTH,
-                                      self.HEIGHT
-        )
-        self.snek8_main_win.centerWindowOnScreen(QGuiApplication.primaryScreen().geometry().width(),
-                                           QGuiApplication.primaryScreen().geometry().height())
-        self.snek8_main_win.setKeys(self.CPU_KEY_MAP, self.APP_KEY_MAP)
-        self.snek8_screen = Snek8Screen(self.snek8_main_win, self.snek8_emulator.isPixelActive)
+        self.snek8_main_win = Snek8MainWindow("Snek8 - Chip8 Emulator")
+        # Built once, with the bound methods themselves as handlers.
+        self._app_key_map = {
+            Qt.Key.Key_P: self.pause,
+            Qt.Key.Key_Escape: self.snek8_main_win.close,
+            Qt.Key.Key_L: self.loadRom,
+        }
+        self.snek8_main_win.setKeys(self._KEY_TABLE, self._app_key_map)
+        self.snek8_screen = Snek8Screen(self.snek8_main_win, self._gfx_view)
         self.snek8_main_win.setCentralWidget(self.snek8_screen)
+        self._update_screen = self.snek8_screen.updateScreen
         self.setStatusBarDefualt()
         self.initMenus()
+        # Fit the window around the fixed-size screen, so the screen is exactly
+        # the area that gets painted.
+        self.snek8_main_win.setFixedSize(self.snek8_main_win.sizeHint())
+        screen_geometry = QGuiApplication.primaryScreen().geometry()
+        self.snek8_main_win.centerWindowOnScreen(screen_geometry.width(), screen_geometry.height())
 
     def initCore(self) -> None:
-        self.snek8_impl_shifts_use_vy = False
-        self.snek8_impl_bnnn_uses_vx = False
-        self.snek8_impl_fx_changes_ir = False
-        self.timer = QTimer()
+        self.rom_filepath = ""
+        # Where the ROM dialog opens; follows the last ROM loaded.
+        self._last_rom_dir = os.getcwd()
+        # Built once per ROM load, not on every pause/resume.
+        self._status_running = ""
+        # The implementation flags checked in the menu; kept across resets.
+        self._impl_flags = 0
+        # The CPU runs in small batches on its own timer, while the screen,
+        # the sound and CHIP8's timers are updated on the frame timer. Both are
+        # plain QObject timers dispatched by timerEvent (0 means not running).
+        self._cpu_timer_id = 0
+        self._render_timer_id = 0
+        self._elapsed = QElapsedTimer()
+        self._elapsed.start()
+        self._cycles = 0
+        # CHIP8's timers follow the elapsed time as well, not the frame count.
+        self._timers_elapsed = QElapsedTimer()
+        self._timers_elapsed.start()
+        self._timer_ticks = 0
         self.is_paused = False
-        self.fps = 120
+        # Set while a ROM is loaded on the worker thread, which writes into the
+        # emulator's memory without holding the GIL.
+        self._loading = False
+        self.fps = 60
+        # Instructions executed per frame; the CPU runs at fps * cycles_per_frame IPS.
+        self.cycles_per_frame = 10
+        self._ips = self.fps * self.cycles_per_frame
+        # Longest stretch of time (in ms) a single CPU tick catches up on.
+        self._max_lag = 100
+        # One CPU tick per frame, i.e. batches of about cycles_per_frame
+        # instructions; shorter ticks would run one instruction per call.
+        self._cpu_interval = 1000 // self.fps
         self.snek8_emulator = snek8core.Snek8Emulator(implm_flags = 0)
+        self._gfx_view = self.snek8_emulator.getGraphicsView()
+        # Bound once: the emulator is reset in place, so these never go stale.
+        self._step_n = self.snek8_emulator.emulationStepN
+        self._set_keys_mask = self.snek8_emulator.setKeysMask
+        self._get_st = self.snek8_emulator.getST
+        self._tick_timers = self.snek8_emulator.tickTimers
+        self._consume_dirty = self.snek8_emulator.consumeDirty
+        # Execution output code -> handler, only looked up when something failed.
+        self._err_handlers = {
+            out: partial(self.showError, err_msg) for out, err_msg in self._ERR_MESSAGES.items()
+        }
 
     def initMenus(self) -> None:
         # File menu
@@ -182,15 +208,17 @@ class Snek8App(QApplication):
         self.snek8_main_win.addMenuItem("Options", "Save state", self.saveState)
         # Implementation
         self.snek8_main_win.addMenu("Implementation")
-        self.snek8_main_win.addCheckMenu('Implementation', "Shifts use VY", self.implmModeShifts)
-        self.snek8_main_win.addCheckMenu('Implementation', "BNNN uses VX", self.implmModeBNNN)
-        self.snek8_main_win.addCheckMenu('Implementation', "FX changes I", self.implmModeFX)
+        for name in self._IMPL_TABLE:
+            self.snek8_main_win.addCheckMenu('Implementation', name, partial(self._toggleImpl, name))
         # Help Menu
         self.snek8_main_win.addMenu("Help")
         self.snek8_main_win.addMenuItem("Help", "Key mappings", self.showKeyBoardMap)
         self.snek8_main_win.addMenuItem("Help", "About", self.showAbout)
 
     def showError(self, err_msg: str) -> None:
+        self.snek8_main_win.status_bar.setText(f"Error: {err_msg}")
+
+    def _noop(self) -> None:
         pass
 
     def handleSound(self, soundtimer: int) -> None:
@@ -200,100 +228,132 @@ class Snek8App(QApplication):
         self.snek8_main_win.status_bar.setText(self.STATUS_BAR_PAUSED)
 
     def setStatusBarRunning(self) -> None:
-        self.snek8_main_win.status_bar.setText(self.STATUS_BAR_RUNNING)
+        self.snek8_main_win.status_bar.setText(self._status_running)
 
     def setStatusBarDefualt(self) -> None:
         self.snek8_main_win.status_bar.setText(self.STATUS_BAR_DEFAULT)
 
 
+    def startEmulationTimer(self) -> None:
+        self.stopEmulationTimer()
+        self._ips = self.fps * self.cycles_per_frame
+        self._cpu_interval = 1000 // self.fps
+        self._elapsed.restart()
+        self._timers_elapsed.restart()
+        self._cpu_timer_id = self.startTimer(self._cpu_interval, Qt.TimerType.PreciseTimer)
+        self._render_timer_id = self.startTimer(1000 // self.fps, Qt.TimerType.PreciseTimer)
+
+    def stopEmulationTimer(self) -> None:
+        if self._cpu_timer_id:
+            self.killTimer(self._cpu_timer_id)
+            self._cpu_timer_id = 0
+        if self._render_timer_id:
+            self.killTimer(self._render_timer_id)
+            self._render_timer_id = 0
+
+    def timerEvent(self, a0: QTimerEvent | None) -> None:
+        timer_id = a0.timerId()
+        if timer_id == self._cpu_timer_id:
+            self.emulate()
+        elif timer_id == self._render_timer_id:
+            self.render()
+        else:
+            super(Snek8App, self).timerEvent(a0)
+
     def pause(self) -> None:
-        if self.snek8_emulator.is_running:
+        if self.snek8_emulator.is_running and not self._loading:
             self.is_paused = False if self.is_paused else True
             if self.is_paused:
+                self.stopEmulationTimer()
                 self.setStatusBarPaused()
             else:
+                self.startEmulationTimer()
                 self.setStatusBarRunning()
 
     def loadRom(self) -> None:
+        # Only needed here, QFileDialog is imported on first use.
+        from PyQt6.QtWidgets import QFileDialog
+        if self._loading:
+            return
         if self.snek8_emulator.is_running:
             self.resetEmulation()
-        self.rom_filepath = QFileDialog.getOpenFileName(
+        rom_filepath = QFileDialog.getOpenFileName(
             parent = self.snek8_main_win,
             caption = "Select a ROM file",
-            directory = os.getcwd()
+            directory = self._last_rom_dir
         )[0]
-        if os.path.isfile(self.rom_filepath):
-            out: int = self.snek8_emulator.loadRom(self.rom_filepath)
-            match out:
-                case snek8core.EXECOUT_SUCCESS:
-                    self.setStatusBarRunning()
-                    pass
-                case snek8core.EXECOUT_ROM_FILE_EXCEEDS_MAX_MEM:
-                    pass
-                case snek8core.EXECOUT_ROM_FILE_FAILED_TO_OPEN:
-                    pass
-                case snek8core.EXECOUT_ROM_FILE_FAILED_TO_READ:
-                    pass
-                case snek8core.EXECOUT_ROM_FILE_NOT_FOUND:
-                    pass
-                case _:
-                    pass
-
-    def implmModeShifts(self) -> None:
-        if self.snek8_main_win.checkable_actions['Shifts use VY'].isChecked():
-            self.snek8_emulator.turnFlagsOn(snek8core.IMPL_MODE_SHIFTS_USE_VY)
-            self.snek8_main_win.checkable_actions['Shifts use VY'].setChecked(True)
+        if rom_filepath:
+            # A ROM always starts from a clean CPU, even when the last one
+            # stopped on an error or failed to load (is_running is then False).
+            self.resetEmulation()
+            # The file is checked and read on a worker thread so that slow
+            # filesystems do not stall the event loop. Until romLoaded arrives
+            # nothing else may touch the emulator.
+            self._loading = True
+            QThreadPool.globalInstance().start(partial(self._loadRomWorker, rom_filepath))
+
+    def _loadRomWorker(self, rom_filepath: str) -> None:
+        if os.path.isfile(rom_filepath):
+            out: int = self.snek8_emulator.loadRom(rom_filepath)
         else:
-            self.snek8_emulator.turnFlagsOff(snek8core.IMPL_MODE_SHIFTS_USE_VY)
-            self.snek8_main_win.checkable_actions['Shifts use VY'].setChecked(False)
-
-    def implmModeBNNN(self) -> None:
-        if self.snek8_main_win.checkable_actions['BNNN uses VX'].isChecked():
-            self.snek8_emulator.turnFlagsOn(snek8core.IMPL_MODE_BNNN_USES_VX)
-            self.snek8_main_win.checkable_actions['BNNN uses VX'].setChecked(True)
+            out = snek8core.EXECOUT_ROM_FILE_NOT_FOUND
+        self.romLoaded.emit(out, rom_filepath)
+
+    def _onRomLoaded(self, out: int, rom_filepath: str) -> None:
+        self._loading = False
+        if out == snek8core.EXECOUT_SUCCESS:
+            self.rom_filepath = rom_filepath
+            self._last_rom_dir = os.path.dirname(self.rom_filepath)
+            self._status_running = f"Now running {self.rom_filepath}"
+            self.startEmulationTimer()
+            self.setStatusBarRunning()
         else:
-            self.snek8_emulator.turnFlagsOff(snek8core.IMPL_MODE_BNNN_USES_VX)
-            self.snek8_main_win.checkable_actions['BNNN uses VX'].setChecked(False)
+            self._err_handlers.get(out, self._noop)()
 
-    def implmModeFX(self) -> None:
-        if self.snek8_main_win.checkable_actions['FX changes I'].isChecked():
-            self.snek8_emulator.turnFlagsOn(snek8core.IMPL_MODE_FX_CHANGES_I)
-            self.snek8_main_win.checkable_actions['FX changes I'].setChecked(True)
-        else:
-            self.snek8_emulator.turnFlagsOff(snek8core.IMPL_MODE_FX_CHANGES_I)
-            self.snek8_main_win.checkable_actions['FX changes I'].setChecked(False)
+    def _toggleImpl(self, name: str) -> None:
+        self._impl_flags ^= self._IMPL_TABLE[name]
+        self.snek8_emulator.setFlags(self._impl_flags)
 
     def emulate(self) -> None:
-        if self.is_paused or (not self.snek8_emulator.is_running):
+        # The number of steps follows the time actually elapsed since the last
+        # tick; the remainder (in instructions * ms) is carried to the next one.
+        # After a stall (e.g. a modal dialog) the lost time is dropped instead
+        # of being run in one burst.
+        self._cycles += min(self._elapsed.restart(), self._max_lag) * self._ips
+        steps, self._cycles = divmod(self._cycles, 1000)
+        if not steps:
             return
-        out: int = self.snek8_emulator.emulationStep()
-        match out:
-            case snek8core.EXECOUT_SUCCESS:
-                pass
-            case snek8core.EXECOUT_EMPTY_STRUCT:
-                pass
-            case snek8core.EXECOUT_INVALID_OPCODE:
-                pass
-            case snek8core.EXECOUT_STACK_EMPTY:
-                pass
-            case snek8core.EXECOUT_STACK_OVERFLOW:
-                pass
-            case _:
-                pass
-        self.handleSound(self.snek8_emulator.getST())
-        self.snek8_screen.update()
+        # The keys pressed since the last tick are loaded all at once.
+        self._set_keys_mask(self.snek8_main_win.keys_down)
+        out: int = self._step_n(steps)
+        # EXECOUT_SUCCESS is 0; anything else means the emulator stopped running.
+        if out:
+            self._handleStepError(out)
+
+    def _handleStepError(self, out: int) -> None:
+        # Kept out of emulate, which only pays for the `if out` test.
+        self.stopEmulationTimer()
+        self._err_handlers.get(out, self._noop)()
+
+    def render(self) -> None:
+        # Same accumulator as in emulate, in ticks * ms: the frame interval is
+        # a whole number of ms, so ticking once per frame would not be 60 Hz.
+        self._timer_ticks += min(self._timers_elapsed.restart(), self._max_lag) * self.TIMERS_HZ
+        ticks, self._timer_ticks = divmod(self._timer_ticks, 1000)
+        for _ in range(ticks):
+            self._tick_timers()
+        self.handleSound(self._get_st())
+        rows = self._consume_dirty()
+        if rows:
+            self._update_screen(self._gfx_view, rows)
 
     def resetEmulation(self) -> None:
-        del(self.snek8_emulator)
-        impl_flags = 0
-        if self.snek8_impl_shifts_use_vy:
-            impl_flags |= 1
-        if self.snek8_impl_bnnn_uses_vx:
-            impl_flags |= (1 << 1)
-        if self.snek8_impl_fx_changes_ir:
-            impl_flags |= (1 << 2)
-        self.snek8_emulator = snek8core.Snek8Emulator(implm_flags = impl_flags)
-        self.snek8_screen.update()
+        if self._loading:
+            return
+        self.stopEmulationTimer()
+        self.is_paused = False
+        self.snek8_emulator.reset(self._impl_flags)
+        self.snek8_screen.updateScreen(self._gfx_view)
         self.setStatusBarDefualt()
 
     def saveState(self) -> None:
@@ -4,7 +4,7 @@
 @license: GPL-3
 @brief: Implementation of the emulator' main window.
 """
-from typing import Callable, Dict, List
+from typing import Callable, Dict, List, Mapping
 from PyQt6.QtWidgets import QMenu, QMenuBar, QMainWindow, QLabel
 from PyQt6.QtGui import QAction, QKeyEvent
 from PyQt6.QtCore import Qt
@@ -16,12 +16,10 @@ class Snek8MainWindow(QMainWindow):
     and the status bar of the app, as well as determine the window geometry of
     the app.
 
+    The window takes its size from its central widget (see `Snek8App.initUI`).
+
     Parameters
     ----------
-    width: int
-        The main window's width.
-    height: int
-        The main window's height.
     title: str
         The main window's title.
 
@@ -35,10 +33,13 @@ class Snek8MainWindow(QMainWindow):
         Contains each of the window menu stored by their respective names.
     checkable_actions: Dict[str, Qaction]
         Contains the checkable options of a given menu.
-    cpu_key_map: Dict[int, Callable]
-        Contains the mapping of CHIP8's key and the respective function that
-        loads the pressed/released key into the emulator.
-    app_key_map: Dict[int, callable]
+    cpu_key_map: List[int]
+        Indexed by the keyboard's key code; contains the bit of the respective
+        CHIP8's key in `keys_down`, or 0 if the key is not bound. Only the
+        Latin-1 key codes (below CPU_KEY_TABLE_SIZE) can be bound.
+    keys_down: int
+        The 16-bit mask of the CHIP8's keys currently pressed (bit k is key k).
+    app_key_map: Mapping[int, callable]
         Contains the mapping of the app's key mapping and the respective function
         that performs the selected action for each pressed key.
     """
@@ -46,12 +47,15 @@ class Snek8MainWindow(QMainWindow):
     status_bar: QLabel
     win_menus: Dict[str, QMenu] = NotImplemented
     checkable_actions: Dict[str, QAction] = NotImplemented
-    cpu_key_map: Dict[int, List[Callable]] = NotImplemented
-    app_key_map: Dict[int, Callable] = NotImplemented
+    cpu_key_map: List[int] = NotImplemented
+    keys_down: int = NotImplemented
+    app_key_map: Mapping[int, Callable] = NotImplemented
+
+    CPU_KEY_TABLE_SIZE: int = 256
 
-    def __init__(self, title: str, width: int, height: int) -> None:
+    def __init__(self, title: str) -> None:
         super(Snek8MainWindow, self).__init__()
-        self.initUI(title, width, height)
+        self.initUI(title)
         self.initCore()
 
     def centerWindowOnScreen(self, screen_w: int, screen_h: int) -> None:
@@ -73,13 +77,12 @@ class Snek8MainWindow(QMainWindow):
         self.menu_toolbar = self.menuBar()
         self.win_menus = {}
         self.checkable_actions = {}
+        self.keys_down = 0
 
-    def initUI(self, title: str, width: int, height: int) -> None:
+    def initUI(self, title: str) -> None:
         """
         Init the correct displaying of the main window.
         """
-        self.setGeometry(0, 0, width, height)
-        self.setFixedSize(width, height)
         self.setWindowTitle(title)
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
         # self.setWindowIcon(icon)
@@ -116,12 +119,17 @@ class Snek8MainWindow(QMainWindow):
             menu_item.triggered.connect(event_fun)
             self.win_menus[menu_name].addAction(menu_item)
 
-    def setKeys(self, cpu_key_map: Dict[int, List[Callable]], app_key_map: Dict[int, Callable]) -> None:
+    def setKeys(self, cpu_key_map: Mapping[int, int], app_key_map: Mapping[int, Callable]) -> None:
         """
-        Load the key bindings.
+        Load the key bindings. `cpu_key_map` maps the keyboard's keys to CHIP8's keys.
         """
-        self.cpu_key_map = cpu_key_map.copy()
-        self.app_key_map = app_key_map.copy()
+        cpu_key_table = [0] * self.CPU_KEY_TABLE_SIZE
+        for key, cpu_key in cpu_key_map.items():
+            if not 0 <= key < self.CPU_KEY_TABLE_SIZE:
+                raise ValueError(f"Key {key:#x} cannot be bound to a CHIP8 key.")
+            cpu_key_table[int(key)] = 1 << cpu_key
+        self.cpu_key_map = cpu_key_table
+        self.app_key_map = app_key_map
 
     def setStatusBarText(self, text: str) -> None:
         """
@@ -132,17 +140,26 @@ class Snek8MainWindow(QMainWindow):
     def keyPressEvent(self, a0: QKeyEvent | None) -> None:
         """
         Listen to a key press and execute the respective action associated with the key.
+        Auto-repeated presses are ignored: the key is already down.
         """
+        if a0.isAutoRepeat():
+            return
         key = a0.key()
-        if key in self.cpu_key_map:
-            self.cpu_key_map[key][1]()
-        elif key in self.app_key_map:
-            self.app_key_map[key]()
+        if key < self.CPU_KEY_TABLE_SIZE:
+            key_bit = self.cpu_key_map[key]
+            if key_bit:
+                self.keys_down |= key_bit
+                return
+        action = self.app_key_map.get(key)
+        if action is not None:
+            action()
 
     def keyReleaseEvent(self, a0: QKeyEvent | None) -> None:
         """
         Listen to a key release and execute the respective action associated with the key.
         """
+        if a0.isAutoRepeat():
+            return
         key = a0.key()
-        if key in self.cpu_key_map:
-            self.cpu_key_map[key][0]()
+        if key < self.CPU_KEY_TABLE_SIZE:
+            self.keys_down &= ~self.cpu_key_map[key]
@@ -5,9 +5,9 @@
 @brief: Implementation of the emulator' display.
 """
 
-from typing import List, Annotated, Callable
-from snek8.core import SIZE_GRAPHICS_WIDTH, SIZE_GRAPHICS_HEIGHT, SIZE_GRAPHICS
-from PyQt6.QtGui import QColor, QPainter, QPaintEvent
+from snek8.core import SIZE_GRAPHICS_WIDTH, SIZE_GRAPHICS_HEIGHT, SIZE_GRAPHICS_BYTES_PER_ROW
+from PyQt6.QtGui import QColor, QImage, QPixmap, QPainter, QPaintEvent, QResizeEvent
+from PyQt6.QtCore import Qt, QRect
 from PyQt6.QtWidgets import QWidget, QFrame
 
 class Snek8Screen(QFrame):
@@ -19,11 +19,19 @@ class Snek8Screen(QFrame):
     parent: QWidget
         The QT widget that controls the screen. In our implementation, this
         would be the main window.
+    screen: memoryview
+        The view of the emulator's screen to display.
 
     Attributes
     ----------
-    snek8_screen: Annotaded[List[int], SIZE_GRAPHICS]
-        The array representation of CHIP8's screen.
+    snek8_screen: memoryview
+        A view of the emulator's screen (see `Snek8Emulator.getGraphicsView`).
+    snek8_image: QImage
+        A monochrome image sharing the memory of `snek8_screen`. Each bit is an
+        index into the colour table [COLOUR_BCKG, COLOUR_FRGR].
+    snek8_pixmap: QPixmap
+        The current frame at the widget's size. `updateScreen` redraws only the
+        pixels that changed into it and paint events only copy from it.
     COLOUR_BCKG: QColor
         The background color to display.
     COLOUR_FRGR: QColor
@@ -32,69 +40,121 @@ class Snek8Screen(QFrame):
         The scale factor to display CHIP8's pixel. Each CHIP8 pixel is represented
         in the app as a SIZE_PIXEL x SIZE_PIXEL square.
     """
-    snek8_screen: Annotated[List[int], SIZE_GRAPHICS] = NotImplemented
-    snek8_lookup_fun: Callable[[int, int], bool]
+    snek8_screen: memoryview = NotImplemented
+    snek8_image: QImage = NotImplemented
+    snek8_pixmap: QPixmap = NotImplemented
+    _prev: bytearray = NotImplemented
 
-    def __init__(self, parent: QWidget, lookup_fun: Callable[[int, int], bool]) -> None:
+    COLOUR_BCKG: QColor = QColor(0, 0, 0)
+    COLOUR_FRGR: QColor = QColor(78, 154, 6)
+    SIZE_PIXEL: int = 10
+    ALL_ROWS: int = (1 << SIZE_GRAPHICS_HEIGHT) - 1
+
+    def __init__(self, parent: QWidget, screen: memoryview) -> None:
         super().__init__(parent)
-        self.snek8_lookup_fun = lookup_fun
-        # self.clearScreen()
+        # The pixmap covers the whole widget, so Qt need neither erase it nor
+        # fill in a system background first.
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground)
+        self.setFixedSize(SIZE_GRAPHICS_WIDTH * self.SIZE_PIXEL, SIZE_GRAPHICS_HEIGHT * self.SIZE_PIXEL)
+        self.setScreen(screen)
 
-    @property
-    def COLOUR_BCKG(self) -> QColor:
-        return QColor(0, 0, 0)
+    def setScreen(self, screen: memoryview) -> None:
+        """
+        Set the view of the CHIP8's pixels and wrap it into a monochrome image.
 
-    @property
-    def COLOUR_FRGR(self) -> QColor:
-        return QColor(78, 154, 6)
+        The image does not copy the pixels, hence it only has to be rebuilt when
+        the view itself changes.
+        """
+        self.snek8_screen = screen
+        self.snek8_image = QImage(screen,
+                                  SIZE_GRAPHICS_WIDTH,
+                                  SIZE_GRAPHICS_HEIGHT,
+                                  SIZE_GRAPHICS_BYTES_PER_ROW,
+                                  QImage.Format.Format_Mono)
+        self.snek8_image.setColorTable([self.COLOUR_BCKG.rgb(), self.COLOUR_FRGR.rgb()])
+        self._prev = bytearray(screen)
+        self.renderPixmap()
 
-    @property
-    def SIZE_PIXEL(self) -> int:
-        return 10
+    def renderPixmap(self) -> None:
+        """
+        Draw the whole frame into `snek8_pixmap`. The pixmap is only allocated
+        again when the widget's size changed.
+        """
+        if self.snek8_pixmap is NotImplemented or self.snek8_pixmap.size() != self.size():
+            self.snek8_pixmap = QPixmap(self.size())
+        self.drawPixels(self.snek8_image.rect())
 
-    # def clearScreen(self) -> None:
-    #     """
-    #     Clear the app screen.
+    def drawPixels(self, source: QRect) -> QRect:
+        """
+        Redraw the CHIP8's pixels in `source` into `snek8_pixmap`. Returns the
+        region of the widget that was redrawn.
+        """
+        width, height = self.width(), self.height()
+        # Both edges are rounded down, hence adjacent regions tile exactly.
+        left = source.left() * width // SIZE_GRAPHICS_WIDTH
+        top = source.top() * height // SIZE_GRAPHICS_HEIGHT
+        right = (source.right() + 1) * width // SIZE_GRAPHICS_WIDTH
+        bottom = (source.bottom() + 1) * height // SIZE_GRAPHICS_HEIGHT
+        target = QRect(left, top, right - left, bottom - top)
+        painter = QPainter(self.snek8_pixmap)
+        painter.drawImage(target, self.snek8_image, source)
+        painter.end()
+        return target
 
-    #     This function does not change the emulator screen.
-    #     """
-    #     self.snek8_screen = [False for _ in range(SIZE_GRAPHICS)]
-    #     self.update()
+    def updateScreen(self, screen: memoryview, rows: int = ALL_ROWS) -> None:
+        """
+        Set the view of the CHIP8's pixels and schedule a repaint of the region
+        whose pixels changed since the last call.
 
-    # def updateScreen(self, screen: Annotated[List[int], SIZE_GRAPHICS]) -> None:
-    #     """
-    #     Set the array representation of the CHIP8's pixels.
-    #     """
-    #     self.snek8_screen = screen
-    #     self.update()
+        Only the rows in the mask `rows` (bit y is row y, see
+        `Snek8Emulator.consumeDirty`) are compared with the previous frame.
+        """
+        if screen is not self.snek8_screen:
+            self.setScreen(screen)
+            self.update()
+            return
+        row_min = (rows & -rows).bit_length() - 1
+        row_max = rows.bit_length() - 1
+        start = row_min * SIZE_GRAPHICS_BYTES_PER_ROW
+        stop = (row_max + 1) * SIZE_GRAPHICS_BYTES_PER_ROW
+        band = screen[start:stop]
+        diff = int.from_bytes(band, "big") ^ int.from_bytes(self._prev[start:stop], "big")
+        if not diff:
+            return
+        self._prev[start:stop] = band
+        self.update(self.drawPixels(self._changedRect(diff, row_min, row_max - row_min + 1)))
+
+    def _changedRect(self, diff: int, row_offset: int, n_rows: int) -> QRect:
+        """
+        The bounding box, in CHIP8's pixels, of the set bits of `diff`.
+        `diff` holds the `n_rows` rows starting at `row_offset`, its most
+        significant bit being the leftmost pixel of the first row.
+        """
+        # Rows: the first and last set bit, 64 bits per row.
+        size = SIZE_GRAPHICS_WIDTH * n_rows
+        row_min = row_offset + (size - diff.bit_length()) // SIZE_GRAPHICS_WIDTH
+        row_max = row_offset + (size - (diff & -diff).bit_length()) // SIZE_GRAPHICS_WIDTH
+        # Columns: fold the rows onto the lowest one, halving them each time.
+        while n_rows > 1:
+            low_bits = (n_rows // 2) * SIZE_GRAPHICS_WIDTH
+            diff = (diff >> low_bits) | (diff & ((1 << low_bits) - 1))
+            n_rows -= n_rows // 2
+        col_min = SIZE_GRAPHICS_WIDTH - diff.bit_length()
+        col_max = SIZE_GRAPHICS_WIDTH - (diff & -diff).bit_length()
+        return QRect(col_min, row_min, col_max - col_min + 1, row_max - row_min + 1)
+
+    def resizeEvent(self, a0: QResizeEvent | None) -> None:
+        """
+        Redraw the frame at the new size of the widget.
+        """
+        super().resizeEvent(a0)
+        self.renderPixmap()
 
     def paintEvent(self, a0: QPaintEvent | None) -> None:
         """
         Draw the screen.
         """
-        _ = a0
+        rect = a0.rect()
         painter = QPainter(self)
-        painter.eraseRect(0, 0, SIZE_GRAPHICS_WIDTH, SIZE_GRAPHICS_HEIGHT)
-        for y in range(SIZE_GRAPHICS_HEIGHT):
-            for x in range(SIZE_GRAPHICS_WIDTH):
-                if self.snek8_lookup_fun(x, y):
-                    colour = self.COLOUR_FRGR
-                else:
-                    colour = self.COLOUR_BCKG
-                painter.fillRect(x * self.SIZE_PIXEL,
-                                  y * self.SIZE_PIXEL,
-                                  self.SIZE_PIXEL,
-                                  self.SIZE_PIXEL,
-                                  colour)
-
-
-                
-                # if self.snek8_screen[y * SIZE_GRAPHICS_WIDTH + x]:
-                #     colour = self.COLOUR_FRGR
-                # else:
-                #     colour = self.COLOUR_BCKG
-                # painter.fillRect(x * self.SIZE_PIXEL,
-                #                   y * self.SIZE_PIXEL,
-                #                   self.SIZE_PIXEL,
-                #                   self.SIZE_PIXEL,
-                #                   colour)
+        painter.drawPixmap(rect, self.snek8_pixmap, rect)
@@ -10,6 +10,8 @@ import os
 import sys
 
 PARENT_DIR: str = 'app/'
+# Set SNEK8_DEBUG to build the core unoptimised and with debug symbols.
+DEBUG: bool = bool(os.environ.get('SNEK8_DEBUG'))
 
 def read(filename: str) -> str:
     return open(os.path.join(os.path.dirname(__file__), filename)).read()
@@ -33,28 +35,42 @@ if os.name != 'nt':
             '-Werror',
             '-Wfloat-equal',
             '-Wpedantic',
-            '-O3',
             '-std=c2x',
-        ]
+        ] + ([
+            '-O0',
+            '-g3',
+        ] if DEBUG else [
+            '-O3',
+            '-march=native',
+            '-flto',
+            '-DNDEBUG',
+        ]),
+        extra_link_args = [] if DEBUG else ['-flto'],
     )
 else:
     snek8_core = Extension(
         name = "snek8.core",
         sources = [
             os.path.join(PARENT_DIR, '_core/src/cpu.c'),
-            os.path.join(PARENT_DIR, '_core/src/emulator.c'),
+            os.path.join(PARENT_DIR, '_core/src/core.c'),
+        ],
+        include_dirs = [
+            os.path.join(PARENT_DIR, '_core/include/'),
         ],
-        include_dirs = os.path.join(PARENT_DIR, '_core/include/'),
         language = 'c',
         extra_compile_args = [
-            '/Wall',
-            '/Wextra',
-            '/Werror',
-            '/Wfloat-equal',
-            '/Wpedantic',
-            '/O3',
-            '/std=c2x'
-        ],
+            '/W4',
+            '/std:clatest',
+        ] + ([
+            '/Od',
+            '/Zi',
+        ] if DEBUG else [
+            '/O2',
+            '/arch:AVX2',
+            '/GL',
+            '/DNDEBUG',
+        ]),
+        extra_link_args = ['/DEBUG'] if DEBUG else ['/LTCG'],
     )
 
 setup(
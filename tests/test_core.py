@@ -0,0 +1,299 @@
+"""
+@file: test_core.py
+@author: Paulo Arruda
+@license: GPL-3
+@brief: Tests of the emulator's core.
+"""
+
+import random
+from typing import List, Tuple
+
+import pytest
+from snek8.core import (
+    Snek8Emulator,
+    EXECOUT_SUCCESS,
+    EXECOUT_STACK_EMPTY,
+    EXECOUT_ROM_FILE_FAILED_TO_OPEN,
+    EXECOUT_ROM_FILE_EXCEEDS_MAX_MEM,
+    IMPL_MODE_SHIFTS_USE_VY,
+    IMPL_MODE_BNNN_USES_VX,
+    IMPL_MODE_FX_CHANGES_I,
+    MEM_ADDR_PROGRM_START,
+    SIZE_MAX_ROM_FILE,
+    SIZE_GRAPHICS,
+    SIZE_GRAPHICS_BYTES,
+    SIZE_GRAPHICS_BYTES_PER_ROW,
+    SIZE_GRAPHICS_HEIGHT,
+    SIZE_GRAPHICS_WIDTH,
+)
+
+def makeEmulator(tmp_path, sprites: bytes) -> Snek8Emulator:
+    """
+    Create an emulator whose ROM holds `sprites`, with no dirty row pending.
+    """
+    rom = tmp_path / "sprites.ch8"
+    rom.write_bytes(sprites)
+    emulator = Snek8Emulator()
+    assert emulator.loadRom(str(rom)) == EXECOUT_SUCCESS
+    emulator.consumeDirty()
+    return emulator
+
+def loadProgram(tmp_path, opcodes: List[int]) -> Snek8Emulator:
+    """
+    Create an emulator running the program made of `opcodes`.
+    """
+    return makeEmulator(tmp_path, b"".join(opc.to_bytes(2, "big") for opc in opcodes))
+
+def draw(emulator: Snek8Emulator, pos_x: int, pos_y: int, address: int, n: int) -> int:
+    """
+    Draw the `n` bytes at `address` at (pos_x, pos_y) using V0 and V1.
+    """
+    assert emulator._execOpc(0x6000 | pos_x) == EXECOUT_SUCCESS
+    assert emulator._execOpc(0x6100 | pos_y) == EXECOUT_SUCCESS
+    assert emulator._execOpc(0xA000 | address) == EXECOUT_SUCCESS
+    return emulator._execOpc(0xD010 | n)
+
+def drawReference(screen: List[bool], sprite: bytes, pos_x: int, pos_y: int) -> Tuple[int, int]:
+    """
+    Draw `sprite` into `screen` one pixel at a time. Returns VF and the mask of
+    the rows the sprite hit.
+    """
+    collision = 0
+    rows = 0
+    for row, byte in enumerate(sprite):
+        y = (pos_y + row) % SIZE_GRAPHICS_HEIGHT
+        if byte:
+            rows |= 1 << y
+        for col in range(8):
+            if byte & (0x80 >> col):
+                idx = y * SIZE_GRAPHICS_WIDTH + (pos_x + col) % SIZE_GRAPHICS_WIDTH
+                collision |= screen[idx]
+                screen[idx] = not screen[idx]
+    return int(collision), rows
+
+def test_draw_wraps_horizontally(tmp_path) -> None:
+    emulator = makeEmulator(tmp_path, b"\xFF")
+    assert draw(emulator, 60, 3, MEM_ADDR_PROGRM_START, 1) == EXECOUT_SUCCESS
+    graphics = emulator.getGraphics()
+    row = graphics[3 * SIZE_GRAPHICS_WIDTH:4 * SIZE_GRAPHICS_WIDTH]
+    assert row == [True] * 4 + [False] * 56 + [True] * 4
+    assert sum(graphics) == 8
+
+def test_draw_wraps_vertically(tmp_path) -> None:
+    emulator = makeEmulator(tmp_path, b"\x80\x80\x80")
+    assert draw(emulator, 5, 30, MEM_ADDR_PROGRM_START, 3) == EXECOUT_SUCCESS
+    for pos_y in (30, 31, 0):
+        assert emulator.isPixelActive(5, pos_y)
+    assert sum(emulator.getGraphics()) == 3
+    assert emulator.consumeDirty() == (1 << 30) | (1 << 31) | 1
+
+def test_draw_start_is_taken_modulo_screen(tmp_path) -> None:
+    emulator = makeEmulator(tmp_path, b"\x80")
+    assert draw(emulator, 64 + 7, 32 + 2, MEM_ADDR_PROGRM_START, 1) == EXECOUT_SUCCESS
+    assert emulator.isPixelActive(7, 2)
+    assert sum(emulator.getGraphics()) == 1
+
+def test_draw_sets_and_clears_vf(tmp_path) -> None:
+    emulator = makeEmulator(tmp_path, b"\xF0")
+    draw(emulator, 10, 10, MEM_ADDR_PROGRM_START, 1)
+    assert emulator.getRegister(0xF) == 0
+    # Drawing the same sprite again erases it.
+    draw(emulator, 10, 10, MEM_ADDR_PROGRM_START, 1)
+    assert emulator.getRegister(0xF) == 1
+    assert sum(emulator.getGraphics()) == 0
+    # A draw without collision clears VF.
+    draw(emulator, 10, 10, MEM_ADDR_PROGRM_START, 1)
+    assert emulator.getRegister(0xF) == 0
+
+def test_draw_collision_across_wrap(tmp_path) -> None:
+    emulator = makeEmulator(tmp_path, b"\x80\x01")
+    # Pixel (1, 0), then a sprite at x = 58 whose last pixel wraps onto it.
+    draw(emulator, 1, 0, MEM_ADDR_PROGRM_START, 1)
+    draw(emulator, 58, 0, MEM_ADDR_PROGRM_START + 1, 1)
+    assert emulator.getRegister(0xF) == 1
+    assert sum(emulator.getGraphics()) == 0
+
+@pytest.mark.parametrize("sprites, n", [(b"\xFF", 0), (b"\x00\x00\x00", 3)])
+def test_empty_draw_leaves_screen_clean(tmp_path, sprites: bytes, n: int) -> None:
+    emulator = makeEmulator(tmp_path, sprites)
+    # Leave VF set, it must be cleared by the empty draw.
+    assert emulator._execOpc(0x6F01) == EXECOUT_SUCCESS
+    assert draw(emulator, 20, 20, MEM_ADDR_PROGRM_START, n) == EXECOUT_SUCCESS
+    assert emulator.getRegister(0xF) == 0
+    assert emulator.consumeDirty() == 0
+    assert sum(emulator.getGraphics()) == 0
+
+def test_consume_dirty_clears_the_mask(tmp_path) -> None:
+    emulator = makeEmulator(tmp_path, b"\x80")
+    draw(emulator, 0, 7, MEM_ADDR_PROGRM_START, 1)
+    assert emulator.consumeDirty() == 1 << 7
+    assert emulator.consumeDirty() == 0
+
+def test_cls_marks_every_row(tmp_path) -> None:
+    emulator = makeEmulator(tmp_path, b"\x80")
+    assert emulator._execOpc(0x00E0) == EXECOUT_SUCCESS
+    assert emulator.consumeDirty() == (1 << SIZE_GRAPHICS_HEIGHT) - 1
+
+def test_graphics_view_bit_layout(tmp_path) -> None:
+    emulator = makeEmulator(tmp_path, b"\x80")
+    view = emulator.getGraphicsView()
+    assert len(view) == SIZE_GRAPHICS_BYTES
+    assert view.readonly
+    for pos_x, pos_y in ((0, 0), (7, 0), (8, 1), (63, 31), (37, 12)):
+        draw(emulator, pos_x, pos_y, MEM_ADDR_PROGRM_START, 1)
+        expected = bytearray(SIZE_GRAPHICS_BYTES)
+        expected[pos_y * SIZE_GRAPHICS_BYTES_PER_ROW + pos_x // 8] = 0x80 >> (pos_x % 8)
+        assert view.tobytes() == bytes(expected)
+        # Erase the pixel again.
+        draw(emulator, pos_x, pos_y, MEM_ADDR_PROGRM_START, 1)
+    assert view.tobytes() == bytes(SIZE_GRAPHICS_BYTES)
+
+def test_draw_matches_pixel_reference(tmp_path) -> None:
+    rng = random.Random(8)
+    sprites = bytes(rng.choice((0, rng.randrange(256))) for _ in range(256))
+    emulator = makeEmulator(tmp_path, sprites)
+    screen = [False] * SIZE_GRAPHICS
+    for _ in range(2000):
+        pos_x, pos_y = rng.randrange(256), rng.randrange(256)
+        offset, n = rng.randrange(256 - 15), rng.randrange(16)
+        draw(emulator, pos_x, pos_y, MEM_ADDR_PROGRM_START + offset, n)
+        collision, rows = drawReference(screen, sprites[offset:offset + n], pos_x, pos_y)
+        assert emulator.getRegister(0xF) == collision
+        assert emulator.consumeDirty() == rows
+        assert emulator.getGraphics() == screen
+
+def test_set_keys_mask() -> None:
+    emulator = Snek8Emulator()
+    emulator.setKeysMask(0b1000_0000_0010_0001)
+    values = [emulator.getKeyValue(key) for key in range(16)]
+    assert all(type(value) is bool for value in values)
+    assert values == [key in (0, 5, 15) for key in range(16)]
+    emulator.setKeysMask(0)
+    assert not any(emulator.getKeyValue(key) for key in range(16))
+
+@pytest.mark.parametrize("mask", [-1, 0x10000])
+def test_set_keys_mask_out_of_range(mask: int) -> None:
+    with pytest.raises(ValueError):
+        Snek8Emulator().setKeysMask(mask)
+
+@pytest.mark.parametrize("mask", [1.0, "1", None])
+def test_set_keys_mask_not_an_int(mask) -> None:
+    with pytest.raises(TypeError):
+        Snek8Emulator().setKeysMask(mask)
+
+def test_get_key_value_out_of_range() -> None:
+    with pytest.raises(IndexError, match="16"):
+        Snek8Emulator().getKeyValue(16)
+
+def test_load_rom_returns_execution_output(tmp_path) -> None:
+    rom = tmp_path / "rom.ch8"
+    rom.write_bytes(b"\x12\x00")
+    emulator = Snek8Emulator()
+    out = emulator.loadRom(str(rom))
+    assert type(out) is int
+    assert out == EXECOUT_SUCCESS
+    assert emulator.is_running
+
+def test_load_rom_missing_file(tmp_path) -> None:
+    emulator = Snek8Emulator()
+    assert emulator.loadRom(str(tmp_path / "missing.ch8")) == EXECOUT_ROM_FILE_FAILED_TO_OPEN
+    assert not emulator.is_running
+
+def test_load_rom_too_large(tmp_path) -> None:
+    rom = tmp_path / "large.ch8"
+    rom.write_bytes(bytes(SIZE_MAX_ROM_FILE + 1))
+    emulator = Snek8Emulator()
+    assert emulator.loadRom(str(rom)) == EXECOUT_ROM_FILE_EXCEEDS_MAX_MEM
+    assert not emulator.is_running
+
+def test_reset_keeps_graphics_view(tmp_path) -> None:
+    emulator = loadProgram(tmp_path, [0x6007, 0x00EE])
+    view = emulator.getGraphicsView()
+    draw(emulator, 3, 4, MEM_ADDR_PROGRM_START, 2)
+    emulator.emulationStepN(2)
+    emulator.consumeDirty()
+    emulator.reset(IMPL_MODE_BNNN_USES_VX)
+    assert view.tobytes() == bytes(SIZE_GRAPHICS_BYTES)
+    assert emulator.consumeDirty() == (1 << SIZE_GRAPHICS_HEIGHT) - 1
+    assert emulator.getPC() == MEM_ADDR_PROGRM_START
+    assert emulator.getRegister(0) == 0
+    assert emulator.getMode() == IMPL_MODE_BNNN_USES_VX
+    assert not emulator.is_running
+    # The view follows the emulator after the reset as well.
+    draw(emulator, 0, 0, 0x50, 1)
+    assert view[0] != 0
+
+def test_reset_rejects_invalid_flags() -> None:
+    with pytest.raises(ValueError):
+        Snek8Emulator().reset(-1)
+
+def test_emulation_step_n_runs_n_steps(tmp_path) -> None:
+    emulator = loadProgram(tmp_path, [0x7001, 0x1200])
+    assert emulator.emulationStepN(10) == EXECOUT_SUCCESS
+    assert emulator.getRegister(0) == 5
+    assert emulator.emulationStepN(0) == EXECOUT_SUCCESS
+    assert emulator.getRegister(0) == 5
+    assert emulator.is_running
+
+def test_emulation_step_n_stops_at_first_error(tmp_path) -> None:
+    emulator = loadProgram(tmp_path, [0x6007, 0x6108, 0x00EE, 0x6209])
+    assert emulator.emulationStepN(10) == EXECOUT_STACK_EMPTY
+    assert emulator.getRegister(0) == 7
+    assert emulator.getRegister(1) == 8
+    assert emulator.getRegister(2) == 0
+    assert not emulator.is_running
+
+def test_emulation_step_n_does_not_tick_timers(tmp_path) -> None:
+    emulator = loadProgram(tmp_path, [0x6005, 0xF015, 0x1204])
+    emulator.emulationStepN(50)
+    assert emulator.getDT() == 5
+
+def test_emulation_step_n_rejects_invalid_counts() -> None:
+    emulator = Snek8Emulator()
+    with pytest.raises(ValueError):
+        emulator.emulationStepN(-1)
+    with pytest.raises(TypeError):
+        emulator.emulationStepN(1.0)
+
+def test_tick_timers() -> None:
+    emulator = Snek8Emulator()
+    assert emulator._execOpc(0x6003) == EXECOUT_SUCCESS
+    assert emulator._execOpc(0xF015) == EXECOUT_SUCCESS
+    assert emulator._execOpc(0x6001) == EXECOUT_SUCCESS
+    assert emulator._execOpc(0xF018) == EXECOUT_SUCCESS
+    emulator.tickTimers()
+    assert (emulator.getDT(), emulator.getST()) == (2, 0)
+    for _ in range(5):
+        emulator.tickTimers()
+    # Both timers stop at 0.
+    assert (emulator.getDT(), emulator.getST()) == (0, 0)
+
+def test_set_flags() -> None:
+    emulator = Snek8Emulator()
+    emulator.setFlags(IMPL_MODE_SHIFTS_USE_VY | IMPL_MODE_FX_CHANGES_I)
+    assert emulator.getMode() == IMPL_MODE_SHIFTS_USE_VY | IMPL_MODE_FX_CHANGES_I
+    emulator.setFlags(0)
+    assert emulator.getMode() == 0
+
+@pytest.mark.parametrize("flags", [-1, 256])
+def test_set_flags_out_of_range(flags: int) -> None:
+    emulator = Snek8Emulator()
+    with pytest.raises(ValueError):
+        emulator.setFlags(flags)
+    assert emulator.getMode() == 0
+
+def test_set_flags_not_an_int() -> None:
+    with pytest.raises(TypeError):
+        Snek8Emulator().setFlags("1")
+
+def test_turn_flags_on_and_off() -> None:
+    all_flags = IMPL_MODE_SHIFTS_USE_VY | IMPL_MODE_BNNN_USES_VX | IMPL_MODE_FX_CHANGES_I
+    emulator = Snek8Emulator()
+    emulator.turnFlagsOn(all_flags)
+    emulator.turnFlagsOff(IMPL_MODE_BNNN_USES_VX)
+    assert emulator.getMode() == all_flags & ~IMPL_MODE_BNNN_USES_VX
+    # Turning a flag off twice keeps it off.
+    emulator.turnFlagsOff(IMPL_MODE_BNNN_USES_VX)
+    assert emulator.getMode() == all_flags & ~IMPL_MODE_BNNN_USES_VX
+    emulator.turnFlagsOn(IMPL_MODE_SHIFTS_USE_VY)
+    assert emulator.getMode() == all_flags & ~IMPL_MODE_BNNN_USES_VX